@@ -0,0 +1,31 @@
+"""
+Ahead-of-time build step for the backtest kernel.
+
+JIT compilation of `run_symbol_core` costs several seconds on the first
+call in each process (walk-forward drivers and worker pools pay it per
+process on a cold cache). Compiling the kernel once into a native
+extension module removes that cold-start entirely:
+
+    python -m backtest.core._aot_build
+
+This produces `engine_aot.*.so` next to this file; `_engine_numba`
+prefers it over the JIT dispatcher when present. The JIT path keeps
+`cache=True` so even without the AOT module the compile cost is paid at
+most once per machine.
+"""
+from numba.pycc import CC
+
+from ._engine_numba import _jit_run_symbol_core
+
+# (entry_idx, exit_idx, side, entry_px, exit_px, reason, R, size, sl, tp)
+_RET = "Tuple((i8[:],i8[:],i1[:],f8[:],f8[:],i1[:],f8[:],f8[:],f8[:],f8[:]))"
+_ARGS = "(f8[:],f8[:],f8[:],f8[:],i8,i8,i8,i8,f8,f8,f8,f8,f8,f8[:],i1[:],i1[:],i1[:],f8[:],f8[:])"
+
+cc = CC("engine_aot")
+cc.verbose = True
+cc.export("run_symbol_core", _RET + _ARGS)(
+    getattr(_jit_run_symbol_core, "py_func", _jit_run_symbol_core)
+)
+
+if __name__ == "__main__":
+    cc.compile()
@@ -0,0 +1,296 @@
+"""
+Numba-jitted hot loop for the fallback-stub backtest path.
+
+`run_symbol_core` inlines the per-bar logic of the local stubs
+(`ATR`, `SlopeRegime`, `PullbackResumption`, `TradeManager`) into a single
+kernel over NumPy columns, so the bar loop runs in native code instead of
+dispatching into four Python objects per bar. The stub classes remain the
+reference implementations; `backtest_engine.run_symbol` only takes this
+path when every component resolved to the local fallbacks (a linked live
+engine always goes through the per-bar Python loop for parity).
+
+If numba is not installed, `njit` degrades to a no-op decorator and the
+kernel runs as plain Python with identical results.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except Exception:  # pragma: no cover - numba optional
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        def wrap(fn):
+            return fn
+        if args and callable(args[0]):
+            return args[0]
+        return wrap
+
+# Enum codes shared with backtest_engine post-processing
+REASON_SL, REASON_TSL, REASON_BE = 0, 1, 2
+REGIME_FLAT, REGIME_UP, REGIME_DOWN = 0, 1, -1
+SIG_NONE, SIG_LONG, SIG_SHORT = 0, 1, -1
+
+
+@njit(cache=True)
+def run_symbol_core(o, h, l, c,
+                    n_short, n_long, ma_lookback, atr_period,
+                    sl_mult, tp_mult, be_prog, tsl_step_mult, risk_usd,
+                    atr_out, regime_out, signal_out, pos_out, sl_out, tp_out):
+    """Run the full bar loop over SoA columns.
+
+    Fills the per-bar timeline arrays in place and returns the closed
+    trades as typed arrays:
+      (entry_idx, exit_idx, side, entry_px, exit_px, reason, R, size, sl, tp)
+    where side is +1/-1 and reason is one of the REASON_* codes.
+    An open trade at the last bar is force-closed at the last close with
+    reason BE and R=0, mirroring the Python engine.
+    """
+    n = o.shape[0]
+    # a trade spans at least two bars, plus one slot for a forced close
+    cap = n // 2 + 2
+    entry_idx = np.empty(cap, np.int64)
+    exit_idx = np.empty(cap, np.int64)
+    side_arr = np.empty(cap, np.int8)
+    entry_px_arr = np.empty(cap, np.float64)
+    exit_px_arr = np.empty(cap, np.float64)
+    reason_arr = np.empty(cap, np.int8)
+    r_arr = np.empty(cap, np.float64)
+    size_arr = np.empty(cap, np.float64)
+    t_sl_arr = np.empty(cap, np.float64)
+    t_tp_arr = np.empty(cap, np.float64)
+
+    # SlopeRegime: two O(1) running sums over ring buffers
+    ring_s = np.zeros(n_short, np.float64)
+    ring_l = np.zeros(n_long, np.float64)
+    sum_s = 0.0
+    sum_l = 0.0
+    idx_s = 0
+    idx_l = 0
+    cnt_s = 0
+    cnt_l = 0
+
+    # PullbackResumption: one running-sum MA plus the pullback flag
+    ring_m = np.zeros(ma_lookback, np.float64)
+    sum_m = 0.0
+    idx_m = 0
+    cnt_m = 0
+    pullback_seen = False
+
+    # Wilder ATR as a scalar recurrence
+    atr_sum = 0.0
+    atr_cnt = 0
+    atr_val = 0.0
+    have_atr = False
+    prev_close = 0.0
+
+    # single active trade as scalars; t_sign folds the side into
+    # arithmetic (+1 long / -1 short) so exit checks need no side branch
+    active = False
+    t_side = 0
+    t_sign = 0.0
+    t_entry_i = 0
+    t_entry_px = 0.0
+    t_sl = 0.0
+    t_tp = 0.0
+    t_size = 0.0
+    t_be_moved = False
+    t_tsl_active = False
+
+    k = 0
+    for i in range(n):
+        hi = h[i]
+        li = l[i]
+        ci = c[i]
+
+        # --- ATR update ---
+        tr = hi - li
+        if i > 0:
+            d1 = hi - prev_close
+            if d1 < 0.0:
+                d1 = -d1
+            d2 = li - prev_close
+            if d2 < 0.0:
+                d2 = -d2
+            if d1 > tr:
+                tr = d1
+            if d2 > tr:
+                tr = d2
+        prev_close = ci
+        if not have_atr:
+            atr_sum += tr
+            atr_cnt += 1
+            if atr_cnt == atr_period:
+                atr_val = atr_sum / atr_period
+                have_atr = True
+        else:
+            atr_val = (atr_val * (atr_period - 1) + tr) / atr_period
+
+        # --- regime update ---
+        old = ring_s[idx_s]
+        ring_s[idx_s] = ci
+        sum_s += ci - old
+        idx_s += 1
+        if idx_s == n_short:
+            idx_s = 0
+        if cnt_s < n_short:
+            cnt_s += 1
+        old = ring_l[idx_l]
+        ring_l[idx_l] = ci
+        sum_l += ci - old
+        idx_l += 1
+        if idx_l == n_long:
+            idx_l = 0
+        if cnt_l < n_long:
+            cnt_l += 1
+        reg = REGIME_FLAT
+        if cnt_l == n_long:
+            ma_s = sum_s / cnt_s
+            ma_l = sum_l / cnt_l
+            if ma_s > ma_l:
+                reg = REGIME_UP
+            elif ma_s < ma_l:
+                reg = REGIME_DOWN
+
+        pos = t_side if active else 0
+        sig = SIG_NONE
+
+        if (not active) and have_atr:
+            # entry path: the signal MA only advances on this branch,
+            # exactly like signal.on_bar in the Python engine
+            old = ring_m[idx_m]
+            ring_m[idx_m] = ci
+            sum_m += ci - old
+            idx_m += 1
+            if idx_m == ma_lookback:
+                idx_m = 0
+            if cnt_m < ma_lookback:
+                cnt_m += 1
+            if cnt_m < ma_lookback or reg == REGIME_FLAT:
+                pullback_seen = False
+            else:
+                ma = sum_m / cnt_m
+                if reg == REGIME_UP:
+                    if ci < ma:
+                        pullback_seen = True
+                    elif pullback_seen:
+                        pullback_seen = False
+                        sig = SIG_LONG
+                else:
+                    if ci > ma:
+                        pullback_seen = True
+                    elif pullback_seen:
+                        pullback_seen = False
+                        sig = SIG_SHORT
+            if sig != SIG_NONE:
+                qty = 0.0
+                sl_dist = atr_val * sl_mult
+                if sl_dist > 0.0 and ci > 0.0:
+                    qty = risk_usd / sl_dist / ci
+                t_side = sig
+                t_sign = 1.0 if sig == SIG_LONG else -1.0
+                t_entry_i = i
+                t_entry_px = ci
+                t_sl = ci - t_sign * sl_dist
+                t_tp = ci + t_sign * tp_mult * atr_val
+                t_size = qty
+                t_be_moved = False
+                t_tsl_active = False
+                active = True
+        elif active:
+            # exit checks -- SL, then TP (using stops as of last bar).
+            # Branchless on side: sign-blended min/max picks the adverse
+            # (low for longs, high for shorts) and favorable extremes
+            # exactly, and the compares fold the side into a multiply.
+            exited = False
+            reason = REASON_SL
+            exit_px = 0.0
+            adverse = t_sign * min(t_sign * li, t_sign * hi)
+            favorable = t_sign * max(t_sign * li, t_sign * hi)
+            if t_sign * (adverse - t_sl) <= 0.0:
+                exit_px = t_sl
+                reason = REASON_TSL if t_tsl_active else REASON_SL
+                exited = True
+            elif t_sign * (favorable - t_tp) >= 0.0:
+                exit_px = t_tp
+                reason = REASON_TSL
+                exited = True
+
+            if exited:
+                sl_dist_abs = abs(sl_mult * atr_val)
+                r = t_sign * (exit_px - t_entry_px) / sl_dist_abs
+                entry_idx[k] = t_entry_i
+                exit_idx[k] = i
+                side_arr[k] = t_side
+                entry_px_arr[k] = t_entry_px
+                exit_px_arr[k] = exit_px
+                reason_arr[k] = reason
+                r_arr[k] = r
+                size_arr[k] = t_size
+                t_sl_arr[k] = t_sl
+                t_tp_arr[k] = t_tp
+                k += 1
+                active = False
+                pos = 0
+            else:
+                # TSL stepping (only once BE has been moved)
+                if t_be_moved:
+                    step = t_sign * tsl_step_mult * atr_val
+                    if t_sign * (ci - (t_entry_px + step)) >= 0.0:
+                        t_tsl_active = True
+                        ns = ci - step
+                        t_sl = t_sign * max(t_sign * t_sl, t_sign * ns)
+                # breakeven move
+                if not t_be_moved:
+                    denom = t_sign * (t_tp - t_entry_px)
+                    prog = t_sign * (ci - t_entry_px) / denom if denom > 0.0 else 0.0
+                    if prog >= be_prog:
+                        t_be_moved = True
+                        t_sl = t_entry_px
+
+        # --- timeline columns ---
+        atr_out[i] = atr_val if have_atr else np.nan
+        regime_out[i] = reg
+        signal_out[i] = sig
+        pos_out[i] = pos
+        if active:
+            sl_out[i] = t_sl
+            tp_out[i] = t_tp
+        else:
+            sl_out[i] = np.nan
+            tp_out[i] = np.nan
+
+    # force-close a still-open trade at the last close as BE
+    if active and n > 0:
+        entry_idx[k] = t_entry_i
+        exit_idx[k] = n - 1
+        side_arr[k] = t_side
+        entry_px_arr[k] = t_entry_px
+        exit_px_arr[k] = c[n - 1]
+        reason_arr[k] = REASON_BE
+        r_arr[k] = 0.0
+        size_arr[k] = t_size
+        t_sl_arr[k] = t_sl
+        t_tp_arr[k] = t_tp
+        k += 1
+
+    return (entry_idx[:k], exit_idx[:k], side_arr[:k], entry_px_arr[:k],
+            exit_px_arr[:k], reason_arr[:k], r_arr[:k], size_arr[:k],
+            t_sl_arr[:k], t_tp_arr[:k])
+
+
+# keep a handle on the JIT dispatcher so _aot_build can re-export it
+_jit_run_symbol_core = run_symbol_core
+
+# Prefer the AOT-compiled kernel when the build step has been run
+# (python -m backtest.core._aot_build); it skips the per-process
+# cold-start compile entirely.
+AOT_COMPILED = False
+try:  # pragma: no cover - depends on a local AOT build
+    from .engine_aot import run_symbol_core as _aot_run_symbol_core
+except ImportError:
+    pass
+else:
+    run_symbol_core = _aot_run_symbol_core
+    AOT_COMPILED = True
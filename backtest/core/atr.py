@@ -1,6 +1,11 @@
 from collections import deque
 from typing import Deque, Optional
 
+import numpy as np
+
+from ._engine_numba import njit
+
+
 class ATR:
     """Simple ATR with Wilder smoothing."""
     def __init__(self, period: int = 14):
@@ -31,3 +36,30 @@ class ATR:
         if self._atr is None:
             return None
         return self._atr
+
+
+@njit(cache=True)
+def _wilder_smooth(tr, atr, period):
+    for i in range(period, tr.shape[0]):
+        atr[i] = (atr[i - 1] * (period - 1) + tr[i]) / period
+
+
+def compute_atr_batch(o, h, l, c, period: int = 14) -> np.ndarray:
+    """Wilder ATR over whole OHLC columns in one shot.
+
+    Matches `ATR.update` bar-for-bar: the first `period - 1` entries are
+    NaN (warmup), entry `period - 1` is the simple mean of the first
+    `period` true ranges, and the rest follow the Wilder recurrence. The
+    true ranges vectorize; the recurrence itself is serial, so it runs
+    through the jitted scalar loop.
+    """
+    n = c.shape[0]
+    atr = np.full(n, np.nan, dtype=np.float64)
+    if n < period:
+        return atr
+    prev_c = np.roll(c, 1)
+    tr = np.maximum.reduce([h - l, np.abs(h - prev_c), np.abs(l - prev_c)])
+    tr[0] = h[0] - l[0]
+    atr[period - 1] = tr[:period].mean()
+    _wilder_smooth(tr, atr, period)
+    return atr
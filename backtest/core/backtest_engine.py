@@ -1,12 +1,29 @@
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timezone
-from .data_loader import iter_symbol_bars
+
+import numpy as np
+
+from .data_loader import iter_symbol_bars, load_symbol_bars_arrays, _iso_minute
 from .adapters import load_regime_classifier, load_signal_engine, load_trade_manager, load_atr, load_position_sizer
-from .reporting import summarize_trades
+from .reporting import summarize_trades, summarize_trades_arrays
 from .atr import ATR
+from . import _engine_numba
 from tqdm.auto import tqdm
 
+# decode tables for the kernel's enum codes
+_SIDE_STR = {_engine_numba.SIG_LONG: "LONG", _engine_numba.SIG_SHORT: "SHORT"}
+_REGIME_STR = {_engine_numba.REGIME_FLAT: "FLAT", _engine_numba.REGIME_UP: "UP", _engine_numba.REGIME_DOWN: "DOWN"}
+_REASON_STR = ("SL", "TSL", "BE")
+
+# prebuilt timeline row template: one bound str.format instead of an
+# 11-operand f-string evaluated per bar
+_TL_FMT = "{},{},{},{},{},{},{},{},{},{},{}\n".format
+
+# trades CSV rows use CRLF to match csv.writer's default line terminator
+_TRADES_HEADER = "symbol,entry_ts,entry_price,side,sl,tp,exit_ts,exit_price,exit_reason,R,size\r\n"
+_TRADE_FMT = "{},{},{},{},{},{},{},{},{},{},{}\r\n".format
+
 def _to_epoch_iso(iso: Optional[str | int | float]) -> Optional[int]:
     if iso is None:
         return None
@@ -43,24 +60,159 @@ def run_symbol(
     exit_cfg = cfg.get("exits", {}).get(symbol, {})
     risk_cfg = cfg.get("risk", {}).get(symbol, {"risk_usd": 1.0})
 
-    # Build components (use attribute/class names from fallbacks)
+    risk_usd = risk_cfg.get("risk_usd", 1.0)
+    sl_mult = exit_cfg.get("sl_mult", 15.0)
+    tp_mult = exit_cfg.get("tp_mult", 60.0)
+    be_prog = exit_cfg.get("breakeven_progress", 0.5)
+    tsl_step_mult = exit_cfg.get("tsl_step_atr_mult", 3.0)
+    atr_period = exit_cfg.get("atr_period", 14)
+
+    # Progress bar setup (per-bar)
+    start_ep = _to_epoch_iso(start) if start else None
+    end_ep = _to_epoch_iso(end) if end else None
+    total_bars: Optional[int] = None
+    if start_ep is not None and end_ep is not None:
+        total_bars = max(0, (end_ep - start_ep) // 60)
+    pbar = tqdm(
+        total=total_bars,
+        desc=f"{symbol} bars",
+        unit="bar",
+        leave=False,
+        dynamic_ncols=True,
+        disable=not progress,
+        mininterval=0.2,
+        miniters=4096,
+        smoothing=0.1,
+    )
+
+    outdir = outputs_dir / "backtest"
+    outdir.mkdir(parents=True, exist_ok=True)
+    timeline_fp = outdir / f"{symbol}_timeline.csv"
+    with open(timeline_fp, "w", buffering=1 << 20, encoding="utf-8") as tf:
+        timeline = _ChunkedWriter(tf)
+        timeline.write("timestamp,open,high,low,close,atr,regime,signal,position,sl,tp\n")
+        soa = None
+        trades = None
+        if reg_fb and sig_fb and tm_fb and atr_fb:
+            # All components are the local stubs: run the compiled kernel.
+            soa = _run_symbol_kernel(
+                symbol, data_root, start, end, pbar, timeline,
+                n_short=int(reg_cfg.get("n_short", 30)),
+                n_long=int(reg_cfg.get("n_long", 120)),
+                ma_lookback=int(sig_cfg.get("ma_lookback", 20)),
+                atr_period=int(atr_period),
+                sl_mult=float(sl_mult),
+                tp_mult=float(tp_mult),
+                be_prog=float(be_prog),
+                tsl_step_mult=float(tsl_step_mult),
+                risk_usd=float(risk_usd),
+            )
+        else:
+            # A live engine is linked: keep the per-bar loop for exact parity.
+            trades = _run_symbol_python(
+                symbol, data_root, start, end, pbar, timeline,
+                reg_mod, sig_mod, tm_mod,
+                reg_cfg, sig_cfg,
+                atr_period, sl_mult, tp_mult, be_prog, tsl_step_mult, risk_usd,
+            )
+        timeline.flush()
+
+    pbar.close()
+
+    if soa is not None:
+        # kernel path: trades stay SoA end-to-end (no dict per trade)
+        ts_list, cols = soa
+        _write_trades_csv_arrays(symbol, ts_list, cols, outdir)
+        return summarize_trades_arrays(cols[6], cols[5], _REASON_STR)
+
+    _write_trades_csv(symbol, trades, outdir)
+
+    # Summary
+    summary = summarize_trades(trades)
+    return summary
+
+
+def _run_symbol_kernel(
+    symbol: str,
+    data_root: Path,
+    start: Optional[str],
+    end: Optional[str],
+    pbar,
+    timeline,
+    *,
+    n_short: int,
+    n_long: int,
+    ma_lookback: int,
+    atr_period: int,
+    sl_mult: float,
+    tp_mult: float,
+    be_prog: float,
+    tsl_step_mult: float,
+    risk_usd: float,
+):
+    """Bulk-load bars as SoA columns, run the njit kernel, decode outputs."""
+    ts_ep, o, h, l, c, _v = load_symbol_bars_arrays(Path(data_root), symbol, start, end)
+    n = ts_ep.shape[0]
+    ts_list = [_iso_minute(int(t)) for t in ts_ep]
+    pbar.update(n)
+
+    atr_arr = np.empty(n, dtype=np.float64)
+    regime_arr = np.empty(n, dtype=np.int8)
+    signal_arr = np.empty(n, dtype=np.int8)
+    pos_arr = np.empty(n, dtype=np.int8)
+    sl_arr = np.empty(n, dtype=np.float64)
+    tp_arr = np.empty(n, dtype=np.float64)
+
+    cols = _engine_numba.run_symbol_core(
+        o, h, l, c,
+        n_short, n_long, ma_lookback, atr_period,
+        sl_mult, tp_mult, be_prog, tsl_step_mult, risk_usd,
+        atr_arr, regime_arr, signal_arr, pos_arr, sl_arr, tp_arr,
+    )
+
+    for i in range(n):
+        a = atr_arr[i]
+        s_v = sl_arr[i]
+        t_v = tp_arr[i]
+        sig_i = int(signal_arr[i])
+        pos_i = int(pos_arr[i])
+        timeline.write(_TL_FMT(
+            ts_list[i], o[i], h[i], l[i], c[i],
+            '' if (np.isnan(a) or a == 0.0) else a,
+            _REGIME_STR[int(regime_arr[i])],
+            _SIDE_STR[sig_i] if sig_i else '',
+            _SIDE_STR[pos_i] if pos_i else 'FLAT',
+            '' if np.isnan(s_v) else s_v,
+            '' if np.isnan(t_v) else t_v,
+        ))
+    return ts_list, cols
+
+
+def _run_symbol_python(
+    symbol: str,
+    data_root: Path,
+    start: Optional[str],
+    end: Optional[str],
+    pbar,
+    timeline,
+    reg_mod, sig_mod, tm_mod,
+    reg_cfg, sig_cfg,
+    atr_period, sl_mult, tp_mult, be_prog, tsl_step_mult, risk_usd,
+):
+    """Per-bar loop over the live (or stub) component objects."""
     regime = reg_mod.SlopeRegime(**reg_cfg)
     signal = sig_mod.PullbackResumption(**sig_cfg)
     exit_params = tm_mod.ExitParams(
-        atr_mult_sl = exit_cfg.get("sl_mult", 15.0),
-        atr_mult_tp = exit_cfg.get("tp_mult", 60.0),
-        breakeven_progress = exit_cfg.get("breakeven_progress", 0.5),
-        tsl_step_atr_mult = exit_cfg.get("tsl_step_atr_mult", 3.0),
+        atr_mult_sl = sl_mult,
+        atr_mult_tp = tp_mult,
+        breakeven_progress = be_prog,
+        tsl_step_atr_mult = tsl_step_mult,
     )
     tm = tm_mod.TradeManager(exit_params)
-    atr = ATR(period=exit_cfg.get("atr_period", 14))
-    risk_usd = risk_cfg.get("risk_usd", 1.0)
-    sl_mult = exit_cfg.get("sl_mult", 15.0)
+    atr = ATR(period=atr_period)
+    pb_count = 0
 
     trades: List[Dict[str, Any]] = []
-    timeline_rows: List[str] = []
-    timeline_header = "timestamp,open,high,low,close,atr,regime,signal,position,sl,tp\n"
-    timeline_rows.append(timeline_header)
 
     def write_trade(t):
         trades.append({
@@ -77,25 +229,7 @@ def run_symbol(
             "size": t.size,
         })
 
-    # Progress bar setup (per-bar)
-    start_ep = _to_epoch_iso(start) if start else None
-    end_ep = _to_epoch_iso(end) if end else None
-    total_bars: Optional[int] = None
-    if start_ep is not None and end_ep is not None:
-        total_bars = max(0, (end_ep - start_ep) // 60)
-    pbar = tqdm(
-        total=total_bars,
-        desc=f"{symbol} bars",
-        unit="bar",
-        leave=False,
-        dynamic_ncols=True,
-        disable=not progress,
-        mininterval=0.2,
-        smoothing=0.1,
-    )
-
-    for bar in iter_symbol_bars(Path(data_root), symbol, start, end):
-        ts = bar["timestamp"]; o=bar["open"]; h=bar["high"]; l=bar["low"]; c=bar["close"]
+    for ts, o, h, l, c, _v in iter_symbol_bars(Path(data_root), symbol, start, end):
         cur_atr = atr.update(o,h,l,c)
         reg = regime.update(c)
         sig = None
@@ -118,10 +252,15 @@ def run_symbol(
                 write_trade(done)
                 pos = "FLAT"
 
-        timeline_rows.append(f"{ts},{o},{h},{l},{c},{cur_atr or ''},{reg},{sig or ''},{pos},{tm.active.sl if tm.active else ''},{tm.active.tp if tm.active else ''}\n")
-        pbar.update(1)
+        t_act = tm.active
+        timeline.write(_TL_FMT(ts, o, h, l, c, cur_atr or '', reg, sig or '', pos,
+                               t_act.sl if t_act else '', t_act.tp if t_act else ''))
+        # batch tqdm ticks: update takes a lock, so once per 4096 bars
+        pb_count += 1
+        if pb_count & 4095 == 0:
+            pbar.update(4096)
 
-    pbar.close()
+    pbar.update(pb_count & 4095)
 
     # If trade still open, force-close at last price as BE
     if tm.active is not None:
@@ -130,10 +269,55 @@ def run_symbol(
         write_trade(t)
         tm.active = None
 
-    # Write artifacts
-    outdir = outputs_dir / "backtest"
-    outdir.mkdir(parents=True, exist_ok=True)
-    # trades CSV
+    return trades
+
+
+class _ChunkedWriter:
+    """Join rows in fixed-size chunks before hitting the file handle, so
+    the timeline never holds more than a chunk of row strings in memory."""
+
+    def __init__(self, fh, chunk: int = 4096):
+        self._fh = fh
+        self._chunk = chunk
+        self._rows: List[str] = []
+
+    def write(self, row: str) -> None:
+        self._rows.append(row)
+        if len(self._rows) >= self._chunk:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._rows:
+            self._fh.write("".join(self._rows))
+            self._rows.clear()
+
+
+def _write_trades_csv_arrays(symbol: str, ts_list, cols, outdir: Path):
+    """Emit the trades CSV in one shot from the kernel's SoA columns."""
+    (entry_idx, exit_idx, side, entry_px, exit_px,
+     reason, r_vals, size, t_sl, t_tp) = cols
+    if entry_idx.shape[0] == 0:
+        return
+    rows = [_TRADES_HEADER]
+    for j in range(entry_idx.shape[0]):
+        rows.append(_TRADE_FMT(
+            symbol,
+            ts_list[entry_idx[j]],
+            float(entry_px[j]),
+            _SIDE_STR[int(side[j])],
+            float(t_sl[j]),
+            float(t_tp[j]),
+            ts_list[exit_idx[j]],
+            float(exit_px[j]),
+            _REASON_STR[int(reason[j])],
+            float(r_vals[j]),
+            float(size[j]),
+        ))
+    with open(outdir / f"{symbol}_trades.csv", "w", newline="", encoding="utf-8") as f:
+        f.write("".join(rows))
+
+
+def _write_trades_csv(symbol: str, trades: List[Dict[str, Any]], outdir: Path):
     trades_csv = outdir / f"{symbol}_trades.csv"
     if trades:
         import csv
@@ -142,10 +326,3 @@ def run_symbol(
             w.writeheader()
             for r in trades:
                 w.writerow(r)
-    # timeline CSV
-    with open(outdir / f"{symbol}_timeline.csv", "w", encoding="utf-8") as f:
-        f.writelines(timeline_rows)
-
-    # Summary
-    summary = summarize_trades(trades)
-    return summary
@@ -1,10 +1,42 @@
 from pathlib import Path
+import calendar
 import csv
-from typing import Iterator, Dict, Any, Optional, Iterable
+import os
+from functools import lru_cache
+from typing import Iterator, Optional, Iterable, Tuple
 from datetime import datetime, timezone
 import re
 
+import numpy as np
+
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+    from pyarrow import parquet as pa_pq
+    _HAVE_PYARROW = True
+except Exception:  # pragma: no cover - pyarrow optional
+    _HAVE_PYARROW = False
+
+# A bar is a flat tuple: (iso_minute, open, high, low, close, volume).
+# Tuples avoid a dict build + 6 hash lookups per bar in the hot path.
+Bar = Tuple[str, float, float, float, float, float]
+
 # --- time helpers ------------------------------------------------------------
+# month (y, m) -> epoch seconds of the 1st, so the per-row fast path is
+# pure integer slicing + arithmetic (no datetime allocation)
+_MONTH_EPOCH_CACHE: dict[tuple[int, int], int] = {}
+
+def _fast_iso_to_epoch(s: str) -> int:
+    """Slice-parse 'YYYY-MM-DD[T ]HH:MM:SS' (UTC) without datetime."""
+    key = (int(s[0:4]), int(s[5:7]))
+    base = _MONTH_EPOCH_CACHE.get(key)
+    if base is None:
+        base = calendar.timegm((key[0], key[1], 1, 0, 0, 0, 0, 0, 0))
+        _MONTH_EPOCH_CACHE[key] = base
+    return (base + (int(s[8:10]) - 1) * 86400
+            + int(s[11:13]) * 3600 + int(s[14:16]) * 60 + int(s[17:19]))
+
+@lru_cache(maxsize=1024)
 def _to_epoch_seconds(ts: Optional[str | int | float]) -> Optional[int]:
     if ts is None:
         return None
@@ -13,7 +45,14 @@ def _to_epoch_seconds(ts: Optional[str | int | float]) -> Optional[int]:
         v = int(s)
         # treat large numbers as milliseconds
         return v // 1000 if v > 1_000_000_000_0 else v
-    # ISO 8601 (allow trailing Z)
+    # fast path for plain UTC ISO strings (the overwhelmingly common case)
+    if len(s) >= 19 and s[4] == "-" and s[7] == "-" and s[10] in "T " \
+            and s[19:] in ("", "Z", "+00:00"):
+        try:
+            return _fast_iso_to_epoch(s)
+        except ValueError:
+            pass
+    # general ISO 8601 (allow trailing Z)
     try:
         dt = datetime.fromisoformat(s.replace("Z", ""))
         if dt.tzinfo is None:
@@ -25,78 +64,136 @@ def _to_epoch_seconds(ts: Optional[str | int | float]) -> Optional[int]:
 def _minute_floor(epoch_s: int) -> int:
     return epoch_s - (epoch_s % 60)
 
+# day ordinal -> 'YYYY-MM-DD', so per-bar formatting is two ints + a join
+_DAY_PREFIX_CACHE: dict[int, str] = {}
+
+@lru_cache(maxsize=1024)
 def _iso_minute(epoch_s: int) -> str:
-    return datetime.fromtimestamp(epoch_s, tz=timezone.utc).replace(second=0, microsecond=0).isoformat(timespec="seconds")
+    d, r = divmod(epoch_s, 86400)
+    prefix = _DAY_PREFIX_CACHE.get(d)
+    if prefix is None:
+        prefix = datetime.fromtimestamp(d * 86400, tz=timezone.utc).strftime("%Y-%m-%d")
+        _DAY_PREFIX_CACHE[d] = prefix
+    m = r // 60
+    return f"{prefix}T{m // 60:02d}:{m % 60:02d}:00+00:00"
 
 # --- schema helpers ----------------------------------------------------------
 TS_ALIASES: tuple[str, ...] = ("timestamp", "ts", "t", "time")
 PRICE_ALIASES: tuple[str, ...] = ("price", "p", "last_price", "close", "c")
 QTY_ALIASES: tuple[str, ...] = ("qty", "quantity", "size", "amount", "volume", "q")
 
-def _first_present(row: Dict[str, Any], keys: Iterable[str]) -> Optional[str]:
-    for k in keys:
-        if k in row:
-            v = row.get(k)
-            if v is not None and str(v).strip() != "":
-                return str(v)
+_SCHEMA_OHLCV = "ohlcv"
+_SCHEMA_TICKS = "ticks"
+# symbol dir -> detected schema kind; months under one symbol share a schema
+_SYMBOL_SCHEMA_CACHE: dict[Path, str] = {}
+
+def _classify_header(header_set: set[str]) -> Optional[str]:
+    """Map a normalized header set to a schema kind (None if unknown)."""
+    if {"open", "high", "low", "close"}.issubset(header_set):
+        return _SCHEMA_OHLCV
+    if (any(p in header_set for p in PRICE_ALIASES)
+            and any(q in header_set for q in QTY_ALIASES)):
+        return _SCHEMA_TICKS
+    return None
+
+def _symbol_schema(symdir: Path, first_file: Path) -> Optional[str]:
+    """Resolve the symbol directory's schema kind once.
+
+    Checked in order: in-process cache, the persisted `.schema` marker,
+    then the first file's header (persisting the marker best-effort so
+    later runs skip detection). Column indices are still resolved from
+    each file's own header; only the kind is shared.
+    """
+    kind = _SYMBOL_SCHEMA_CACHE.get(symdir)
+    if kind is not None:
+        return kind
+    marker = symdir / ".schema"
+    try:
+        kind = marker.read_text(encoding="utf-8").strip() or None
+    except OSError:
+        kind = None
+    if kind not in (_SCHEMA_OHLCV, _SCHEMA_TICKS):
+        _, tokens_l = _read_header_tokens(first_file)
+        kind = _classify_header(set(tokens_l))
+        if kind is not None:
+            try:
+                marker.write_text(kind + "\n", encoding="utf-8")
+            except OSError:
+                pass  # data dirs may be read-only
+    if kind is not None:
+        _SYMBOL_SCHEMA_CACHE[symdir] = kind
+    return kind
+
+def _first_index(tokens: list[str], aliases: Iterable[str]) -> Optional[int]:
+    """Index of the first alias present in the normalized header tokens."""
+    for a in aliases:
+        if a in tokens:
+            return tokens.index(a)
     return None
 
+def _read_header_tokens(path: Path) -> tuple[str, list[str]]:
+    """Read the raw header line and return it with normalized tokens."""
+    with open(path, "r", newline="", encoding="utf-8") as f:
+        raw_header = (f.readline() or "").strip()
+    # parse tokens with csv to honor quotes; also handle BOM on first token
+    try:
+        tokens = next(csv.reader([raw_header])) if raw_header else []
+    except Exception:
+        tokens = [c.strip() for c in raw_header.split(",") if c.strip()]
+    tokens_l = [t.strip().lower().lstrip("\ufeff") for t in tokens]
+    return raw_header, tokens_l
+
 # --- readers -----------------------------------------------------------------
-def _iter_ohlcv_file(path: Path) -> Iterator[Dict[str, Any]]:
+def _iter_ohlcv_file(path: Path, ts_i: int, o_i: int, h_i: int, l_i: int,
+                     c_i: int, v_i: Optional[int]) -> Iterator[Bar]:
     with open(path, "r", newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
+        reader = csv.reader(f)
+        next(reader, None)  # header
         for row in reader:
-            # normalize keys to lowercase and strip potential BOM to be permissive
-            row_l = { (k.lower().lstrip("\ufeff") if isinstance(k, str) else k): v for k, v in row.items() }
-            ep = _to_epoch_seconds(_first_present(row_l, TS_ALIASES))
-            yield {
-                "timestamp": _iso_minute(ep),
-                "open": float(row_l["open"]),
-                "high": float(row_l["high"]),
-                "low": float(row_l["low"]),
-                "close": float(row_l["close"]),
-                "volume": float(row_l.get("volume", 0.0)),
-            }
-
-def _iter_ticks_aggregated_1m(path: Path) -> Iterator[Dict[str, Any]]:
+            ep = _to_epoch_seconds(row[ts_i])
+            yield (
+                _iso_minute(ep),
+                float(row[o_i]),
+                float(row[h_i]),
+                float(row[l_i]),
+                float(row[c_i]),
+                float(row[v_i]) if v_i is not None else 0.0,
+            )
+
+def _iter_ticks_aggregated_1m(path: Path, ts_i: int, px_i: int,
+                              qty_i: Optional[int]) -> Iterator[Bar]:
     """Aggregate trade ticks to 1-minute OHLCV.
 
-    Accepts varied headers and ignores unknown columns.
-    - Timestamp aliases: TS_ALIASES
-    - Price aliases: PRICE_ALIASES
-    - Quantity aliases: QTY_ALIASES (defaults to 0.0 if absent)
+    Column indices are resolved once from the header by the caller;
+    rows are indexed directly (no per-row dict or alias scan).
     """
     with open(path, "r", newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
+        reader = csv.reader(f)
+        next(reader, None)  # header
         cur_min: Optional[int] = None
         o = h = l = c = None  # type: ignore[assignment]
         vol = 0.0
         for row in reader:
-            # normalize keys to lowercase, strip BOM, ignore extras
-            row_l: Dict[str, Any] = { (k.lower().lstrip("\ufeff") if isinstance(k, str) else k): v for k, v in row.items() }
-
-            ts_raw = _first_present(row_l, TS_ALIASES)
-            if ts_raw is None:
+            ts_raw = row[ts_i] if ts_i < len(row) else ""
+            if not ts_raw.strip():
                 # no timestamp -> skip row
                 continue
             ep = _to_epoch_seconds(ts_raw)
             m = _minute_floor(ep)
 
-            p_raw = _first_present(row_l, PRICE_ALIASES)
-            if p_raw is None:
-                # no price -> skip row
-                continue
+            p_raw = row[px_i] if px_i < len(row) else ""
             try:
                 p = float(p_raw)
             except Exception:
-                # bad price -> skip
+                # missing/bad price -> skip
                 continue
 
-            q_raw = _first_present(row_l, QTY_ALIASES)
-            try:
-                q = float(q_raw) if q_raw is not None else 0.0
-            except Exception:
-                q = 0.0
+            q = 0.0
+            if qty_i is not None and qty_i < len(row):
+                try:
+                    q = float(row[qty_i])
+                except Exception:
+                    q = 0.0
 
             if cur_min is None:
                 cur_min = m
@@ -106,10 +203,7 @@ def _iter_ticks_aggregated_1m(path: Path) -> Iterator[Dict[str, Any]]:
 
             if m != cur_min:
                 # flush previous minute
-                yield {
-                    "timestamp": _iso_minute(cur_min),
-                    "open": o, "high": h, "low": l, "close": c, "volume": vol,
-                }
+                yield (_iso_minute(cur_min), o, h, l, c, vol)
                 # start new minute
                 cur_min = m
                 o = h = l = c = p
@@ -123,12 +217,9 @@ def _iter_ticks_aggregated_1m(path: Path) -> Iterator[Dict[str, Any]]:
 
         # flush last minute
         if cur_min is not None:
-            yield {
-                "timestamp": _iso_minute(cur_min),
-                "open": o, "high": h, "low": l, "close": c, "volume": vol,
-            }
+            yield (_iso_minute(cur_min), o, h, l, c, vol)
 
-def iter_ohlcv_csv(path: Path) -> Iterator[Dict[str, Any]]:
+def iter_ohlcv_csv(path: Path, schema: Optional[str] = None) -> Iterator[Bar]:
     """Yield bars from either:
        - 1-minute OHLCV CSV: timestamp,open,high,low,close,volume
        - Ticks CSV: timestamp,price/aliases,qty/aliases,[...]
@@ -137,50 +228,227 @@ def iter_ohlcv_csv(path: Path) -> Iterator[Dict[str, Any]]:
     - OHLCV if {open,high,low,close} ⊆ header
     - Ticks if any price-alias ∧ any quantity-alias in header
     - Otherwise raise with raw header line
+
+    Column indices are resolved here, once per file, so the row loops
+    index tuples directly instead of building per-row dicts. Passing a
+    pre-detected `schema` kind skips the classification.
     """
     if not path.exists():
         raise FileNotFoundError(f"Data file not found: {path}")
 
-    # Read raw header line and also parse into tokens safely
-    with open(path, "r", newline="", encoding="utf-8") as f:
-        raw_header = (f.readline() or "").strip()
-    # parse tokens with csv to honor quotes; also handle BOM on first token
-    try:
-        tokens = next(csv.reader([raw_header])) if raw_header else []
-    except Exception:
-        tokens = [c.strip() for c in raw_header.split(",") if c.strip()]
-    tokens_l = [t.strip().lower().lstrip("\ufeff") for t in tokens]
+    raw_header, tokens_l = _read_header_tokens(path)
     header_set = set(tokens_l)
 
     # choose reader by schema
-    if {"open", "high", "low", "close"}.issubset(header_set):
-        yield from _iter_ohlcv_file(path)
-    elif (any(p in header_set for p in PRICE_ALIASES) and any(q in header_set for q in QTY_ALIASES)):
-        yield from _iter_ticks_aggregated_1m(path)
+    kind = schema or _classify_header(header_set)
+    if kind == _SCHEMA_OHLCV:
+        ts_i = _first_index(tokens_l, TS_ALIASES)
+        yield from _iter_ohlcv_file(
+            path,
+            ts_i if ts_i is not None else 0,
+            tokens_l.index("open"),
+            tokens_l.index("high"),
+            tokens_l.index("low"),
+            tokens_l.index("close"),
+            tokens_l.index("volume") if "volume" in header_set else None,
+        )
+    elif kind == _SCHEMA_TICKS:
+        ts_i = _first_index(tokens_l, TS_ALIASES)
+        if ts_i is None:
+            # no timestamp column: every row would be skipped anyway
+            return
+        yield from _iter_ticks_aggregated_1m(
+            path,
+            ts_i,
+            _first_index(tokens_l, PRICE_ALIASES),
+            _first_index(tokens_l, QTY_ALIASES),
+        )
     else:
         raise ValueError(f"Unrecognized CSV schema in {path.name}: {raw_header}")
 
- 
+# --- bulk (columnar) readers -------------------------------------------------
+def _epoch_seconds_array(col) -> np.ndarray:
+    """Convert a pyarrow timestamp/int/string column to epoch seconds.
+
+    Raises on null entries: casting an int column with nulls goes
+    through float64/NaN and lands on garbage int64 values, so callers
+    with a row-level fallback (the tick path) re-parse there instead,
+    matching the streaming aggregator's skip-the-row behavior.
+    """
+    if col.null_count:
+        raise ValueError("timestamp column contains nulls")
+    if pa.types.is_timestamp(col.type):
+        div = {"s": 1, "ms": 1_000, "us": 1_000_000, "ns": 1_000_000_000}[col.type.unit]
+        return (col.cast(pa.int64()).to_numpy() // div).astype(np.int64)
+    if pa.types.is_integer(col.type):
+        v = col.cast(pa.int64()).to_numpy()
+        # same ms-vs-s heuristic as _to_epoch_seconds, vectorized
+        return np.where(v > 1_000_000_000_0, v // 1000, v).astype(np.int64)
+    vals = col.to_pylist()
+    return np.fromiter((_to_epoch_seconds(x) for x in vals), np.int64, len(vals))
+
+def _ohlcv_arrays_pyarrow(path: Path, ts_i: int, o_i: int, h_i: int, l_i: int,
+                          c_i: int, v_i: Optional[int]):
+    """SIMD-parse an OHLCV CSV into typed columns via pyarrow.csv."""
+    table = pa_csv.read_csv(path)
+    ts = _epoch_seconds_array(table.column(ts_i))
+    ts -= ts % 60  # minute floor, matching _iso_minute
+    def _f8(i):
+        return table.column(i).cast(pa.float64()).to_numpy(zero_copy_only=False)
+    vol = _f8(v_i) if v_i is not None else np.zeros(len(ts), np.float64)
+    return ts, _f8(o_i), _f8(h_i), _f8(l_i), _f8(c_i), vol
+
+def _ticks_arrays_pyarrow(path: Path, ts_i: int, px_i: int, qty_i: Optional[int]):
+    """SIMD-parse a ticks CSV and aggregate to 1-minute bars in NumPy.
+
+    Mirrors the streaming aggregator exactly: rows without a parsable
+    price are dropped, a missing qty counts as 0, and a bar is flushed
+    whenever the minute *changes* (run-length segments, not a sort-based
+    groupby), so out-of-order input produces the same bars as the row
+    loop. Raises on anything unusual (null timestamps, string price
+    columns); the caller falls back to the row aggregator.
+    """
+    table = pa_csv.read_csv(path)
+    ts = _epoch_seconds_array(table.column(ts_i))
+    px = table.column(px_i).cast(pa.float64()).to_numpy(zero_copy_only=False)
+    if qty_i is not None:
+        qty = table.column(qty_i).cast(pa.float64()).to_numpy(zero_copy_only=False)
+        qty = np.nan_to_num(qty, nan=0.0)
+    else:
+        qty = np.zeros(ts.shape[0], np.float64)
+
+    good = ~np.isnan(px)
+    if not good.all():
+        ts, px, qty = ts[good], px[good], qty[good]
+    n = ts.shape[0]
+    if n == 0:
+        z = np.zeros(0, np.float64)
+        return np.zeros(0, np.int64), z, z, z, z, z
+
+    m = ts - ts % 60
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(m)) + 1))
+    lasts = np.concatenate((starts[1:], [n])) - 1
+    return (
+        m[starts],
+        px[starts],                       # open
+        np.maximum.reduceat(px, starts),  # high
+        np.minimum.reduceat(px, starts),  # low
+        px[lasts],                        # close
+        np.add.reduceat(qty, starts),     # volume
+    )
+
+_CACHE_COLS = ("ts", "open", "high", "low", "close", "volume")
+
+def _cached_path(fp: Path) -> Path:
+    return fp.with_suffix(".parquet")
+
+def _read_bar_cache(fp: Path):
+    table = pa_pq.read_table(_cached_path(fp))
+    return tuple(table.column(name).to_numpy() for name in _CACHE_COLS)
+
+def _write_bar_cache(fp: Path, cols) -> None:
+    # best effort: data dirs may be read-only
+    try:
+        table = pa.table(dict(zip(_CACHE_COLS, cols)))
+        pa_pq.write_table(table, _cached_path(fp), compression="zstd")
+    except Exception:
+        pass
+
+def _file_bar_arrays(path: Path, schema: Optional[str] = None):
+    """Load one CSV as (ts, o, h, l, c, v) NumPy columns, through the
+    Parquet cache when possible.
+
+    The first parse of a file (CSV for OHLCV, or the tick->1m
+    aggregation) is written next to it as a zstd Parquet keyed on mtime;
+    later runs — walk-forward folds and parameter sweeps re-read the same
+    months constantly — decode the cache instead of re-parsing."""
+    if _HAVE_PYARROW:
+        cached = _cached_path(path)
+        try:
+            if cached.exists() and cached.stat().st_mtime >= path.stat().st_mtime:
+                return _read_bar_cache(path)
+        except Exception:
+            pass  # unreadable/corrupt cache: fall through to a re-parse
+        cols = _parse_bar_arrays(path, schema)
+        _write_bar_cache(path, cols)
+        return cols
+    return _parse_bar_arrays(path, schema)
+
+def _parse_bar_arrays(path: Path, schema: Optional[str] = None):
+    """Parse one CSV as (ts, o, h, l, c, v) NumPy columns (ts in epoch
+    seconds, minute-floored). Both schemas go through pyarrow when it is
+    installed; the no-pyarrow case (and tick files pyarrow cannot type)
+    falls back to the row iterator."""
+    raw_header, tokens_l = _read_header_tokens(path)
+    header_set = set(tokens_l)
+    kind = schema or _classify_header(header_set)
+    if _HAVE_PYARROW and kind == _SCHEMA_OHLCV:
+        ts_i = _first_index(tokens_l, TS_ALIASES)
+        return _ohlcv_arrays_pyarrow(
+            path,
+            ts_i if ts_i is not None else 0,
+            tokens_l.index("open"),
+            tokens_l.index("high"),
+            tokens_l.index("low"),
+            tokens_l.index("close"),
+            tokens_l.index("volume") if "volume" in header_set else None,
+        )
+    if _HAVE_PYARROW and kind == _SCHEMA_TICKS:
+        try:
+            return _ticks_arrays_pyarrow(
+                path,
+                _first_index(tokens_l, TS_ALIASES),
+                _first_index(tokens_l, PRICE_ALIASES),
+                _first_index(tokens_l, QTY_ALIASES),
+            )
+        except Exception:
+            pass  # odd column content: the row aggregator handles it
+    bars = list(iter_ohlcv_csv(path, schema=kind))
+    n = len(bars)
+    ts = np.fromiter((_to_epoch_seconds(b[0]) for b in bars), np.int64, n)
+    o = np.fromiter((b[1] for b in bars), np.float64, n)
+    h = np.fromiter((b[2] for b in bars), np.float64, n)
+    l = np.fromiter((b[3] for b in bars), np.float64, n)
+    c = np.fromiter((b[4] for b in bars), np.float64, n)
+    v = np.fromiter((b[5] for b in bars), np.float64, n)
+    return ts, o, h, l, c, v
+
+
+def _month_bounds(y: int, mo: int) -> tuple[int, int]:
+    """[start, end) epoch seconds of a UTC month."""
+    start = calendar.timegm((y, mo, 1, 0, 0, 0, 0, 0, 0))
+    if mo == 12:
+        end = calendar.timegm((y + 1, 1, 1, 0, 0, 0, 0, 0, 0))
+    else:
+        end = calendar.timegm((y, mo + 1, 1, 0, 0, 0, 0, 0, 0))
+    return start, end
 
 def _yymm_from_name(name: str):
+    # fast path: the '<SYMBOL>-YYYY-MM.csv' convention slices without the regex
+    if name.endswith(".csv") and len(name) >= 12 and name[-7] == "-":
+        y_s, mo_s = name[-11:-7], name[-6:-4]
+        if y_s.isdigit() and mo_s.isdigit() and name[-12] in "-_":
+            mo = int(mo_s)
+            if 1 <= mo <= 12:
+                return _month_bounds(int(y_s), mo)
     m = re.search(r"(\d{4})[-_](\d{2})", name)
     if not m:
         return None
-    y, mo = int(m.group(1)), int(m.group(2))
-    start = datetime(y, mo, 1, tzinfo=timezone.utc)
-    # month end = first day of next month
-    if mo == 12:
-        end = datetime(y + 1, 1, 1, tzinfo=timezone.utc)
-    else:
-        end = datetime(y, mo + 1, 1, tzinfo=timezone.utc)
-    return int(start.timestamp()), int(end.timestamp())
+    return _month_bounds(int(m.group(1)), int(m.group(2)))
 
 def find_symbol_csvs(
     data_root: Path, symbol: str, start: Optional[str], end: Optional[str]
 ):
     """Return only files that could overlap [start,end)."""
     symdir = data_root / symbol
-    files = sorted(symdir.glob("*.csv"))
+    # scandir avoids glob's per-entry stat; name sort matches the old
+    # path sort within a single directory
+    try:
+        with os.scandir(symdir) as it:
+            names = sorted(e.name for e in it if e.name.endswith(".csv"))
+    except OSError:
+        names = []
+    files = [symdir / n for n in names]
     import logging
     log = logging.getLogger("backtest")
     if not files:
@@ -211,14 +479,45 @@ def find_symbol_csvs(
     )
     return kept
 
-def iter_symbol_bars(data_root: Path, symbol: str, start: Optional[str], end: Optional[str]):
+def iter_symbol_bars(data_root: Path, symbol: str, start: Optional[str], end: Optional[str]) -> Iterator[Bar]:
     start_ep = _to_epoch_seconds(start) if start else None
     end_ep = _to_epoch_seconds(end) if end else None
-    for fp in find_symbol_csvs(data_root, symbol, start, end):
-        for bar in iter_ohlcv_csv(fp):
-            ts_ep = _to_epoch_seconds(bar["timestamp"])
+    files = find_symbol_csvs(data_root, symbol, start, end)
+    schema = _symbol_schema(data_root / symbol, files[0]) if files else None
+    for fp in files:
+        for bar in iter_ohlcv_csv(fp, schema=schema):
+            ts_ep = _to_epoch_seconds(bar[0])
             if start_ep is not None and ts_ep < start_ep:
                 continue
             if end_ep is not None and ts_ep >= end_ep:
                 continue
             yield bar
+
+def load_symbol_bars_arrays(data_root: Path, symbol: str, start: Optional[str], end: Optional[str]):
+    """Bulk-load all bars for a symbol as SoA NumPy columns.
+
+    Returns (ts, o, h, l, c, v) with ts in minute-floored epoch seconds,
+    concatenated across the window-filtered monthly files. This is the
+    ingestion path for the njit kernel; the row iterator above remains
+    for per-bar consumers."""
+    start_ep = _to_epoch_seconds(start) if start else None
+    end_ep = _to_epoch_seconds(end) if end else None
+    parts: list[tuple] = []
+    files = find_symbol_csvs(data_root, symbol, start, end)
+    schema = _symbol_schema(data_root / symbol, files[0]) if files else None
+    for fp in files:
+        cols = _file_bar_arrays(fp, schema)
+        ts = cols[0]
+        if start_ep is not None or end_ep is not None:
+            mask = np.ones(ts.shape[0], dtype=bool)
+            if start_ep is not None:
+                mask &= ts >= start_ep
+            if end_ep is not None:
+                mask &= ts < end_ep
+            if not mask.all():
+                cols = tuple(a[mask] for a in cols)
+        if cols[0].shape[0]:
+            parts.append(cols)
+    if not parts:
+        return (np.empty(0, np.int64),) + tuple(np.empty(0, np.float64) for _ in range(5))
+    return tuple(np.concatenate([p[i] for p in parts]) for i in range(6))
@@ -1,22 +1,40 @@
-from collections import deque
+from array import array
 
 class SlopeRegime:
-    """Very simple slope-based regime: up if MA(close, n_short) > MA(close, n_long)."""
+    """Very simple slope-based regime: up if MA(close, n_short) > MA(close, n_long).
+
+    The rolling means are maintained as O(1) running sums over fixed-size
+    ring buffers instead of summing a deque on every update.
+    """
     def __init__(self, n_short: int = 30, n_long: int = 120):
         self.n_short = n_short
         self.n_long = n_long
-        self.buf_s = deque(maxlen=n_short)
-        self.buf_l = deque(maxlen=n_long)
+        self._ring_s = array('d', [0.0] * n_short)
+        self._ring_l = array('d', [0.0] * n_long)
+        self._sum_s = 0.0
+        self._sum_l = 0.0
+        self._idx_s = 0
+        self._idx_l = 0
+        self._filled_s = 0
+        self._filled_l = 0
         self._regime = "FLAT"
 
     def update(self, price: float):
-        self.buf_s.append(price)
-        self.buf_l.append(price)
-        if len(self.buf_l) < self.n_long:
+        self._sum_s += price - self._ring_s[self._idx_s]
+        self._ring_s[self._idx_s] = price
+        self._idx_s = (self._idx_s + 1) % self.n_short
+        if self._filled_s < self.n_short:
+            self._filled_s += 1
+        self._sum_l += price - self._ring_l[self._idx_l]
+        self._ring_l[self._idx_l] = price
+        self._idx_l = (self._idx_l + 1) % self.n_long
+        if self._filled_l < self.n_long:
+            self._filled_l += 1
+        if self._filled_l < self.n_long:
             self._regime = "FLAT"
             return self._regime
-        ma_s = sum(self.buf_s) / len(self.buf_s)
-        ma_l = sum(self.buf_l) / len(self.buf_l)
+        ma_s = self._sum_s / self._filled_s
+        ma_l = self._sum_l / self._filled_l
         if ma_s > ma_l:
             self._regime = "UP"
         elif ma_s < ma_l:
@@ -1,20 +1,46 @@
 import json
 from pathlib import Path
-from statistics import mean, median
+
+import numpy as np
 
 def summarize_trades(trades):
-    exits = {"SL":0, "BE":0, "TSL":0}
-    Rs = []
-    for t in trades:
-        exits[t.get("exit_reason","SL")] = exits.get(t.get("exit_reason","SL"), 0) + 1
-        Rs.append(t.get("R", 0.0))
-    win_rate = (exits.get("TSL",0) + exits.get("BE",0)) / max(1, sum(exits.values()))
-    avg_R = mean(Rs) if Rs else 0.0
-    med_R = median(Rs) if Rs else 0.0
-    sum_R = sum(Rs) if Rs else 0.0
-    G = (exits.get("TSL",0) + exits.get("BE",0)) / max(1, exits.get("SL",0))
+    n = len(trades)
+    rs = np.fromiter((t.get("R", 0.0) for t in trades), dtype=np.float64, count=n)
+    reasons = np.array([t.get("exit_reason", "SL") for t in trades])
+    exits = {"SL": 0, "BE": 0, "TSL": 0}
+    if n:
+        uniq, counts = np.unique(reasons, return_counts=True)
+        exits.update(zip(uniq.tolist(), counts.tolist()))
+    win_rate = (exits.get("TSL", 0) + exits.get("BE", 0)) / max(1, sum(exits.values()))
+    avg_R = float(rs.mean()) if n else 0.0
+    med_R = float(np.median(rs)) if n else 0.0
+    sum_R = float(rs.sum()) if n else 0.0
+    G = (exits.get("TSL", 0) + exits.get("BE", 0)) / max(1, exits.get("SL", 0))
+    return {
+        "trades": n,
+        "exits": exits,
+        "win_rate": win_rate,
+        "avg_R": avg_R,
+        "median_R": med_R,
+        "sum_R": sum_R,
+        "G": G,
+    }
+
+def summarize_trades_arrays(r_vals, reason_codes, reason_names=("SL", "TSL", "BE")):
+    """summarize_trades over SoA trade columns (the kernel path), where
+    exit reasons are small integer codes indexing `reason_names`."""
+    n = int(r_vals.shape[0])
+    counts = np.bincount(reason_codes, minlength=len(reason_names))
+    exits = {"SL": 0, "BE": 0, "TSL": 0}
+    for code, name in enumerate(reason_names):
+        exits[name] = int(counts[code])
+    win_rate = (exits.get("TSL", 0) + exits.get("BE", 0)) / max(1, sum(exits.values()))
+    avg_R = float(r_vals.mean()) if n else 0.0
+    med_R = float(np.median(r_vals)) if n else 0.0
+    sum_R = float(r_vals.sum()) if n else 0.0
+    G = (exits.get("TSL", 0) + exits.get("BE", 0)) / max(1, exits.get("SL", 0))
     return {
-        "trades": len(trades),
+        "trades": n,
         "exits": exits,
         "win_rate": win_rate,
         "avg_R": avg_R,
@@ -1,4 +1,4 @@
-from collections import deque
+from array import array
 
 class PullbackResumption:
     """Simplified entry: In UP regime, require a pullback (price below MA) then close back above.
@@ -6,17 +6,26 @@ class PullbackResumption:
       - ma_lookback
       - pullback_frac (0..1) : minimum pullback below/above MA as a fraction of ATR or MA (here MA)
     This is a placeholder; live engine should be imported via adapters for parity.
+
+    The MA is an O(1) running sum over a ring buffer (no per-bar sum()).
     """
     def __init__(self, ma_lookback: int = 20, pullback_frac: float = 0.002):
         self.lookback = ma_lookback
-        self.buf = deque(maxlen=ma_lookback)
+        self._ring = array('d', [0.0] * ma_lookback)
+        self._sum = 0.0
+        self._idx = 0
+        self._filled = 0
         self.pullback_seen = False
 
     def update_ma(self, price: float):
-        self.buf.append(price)
-        if len(self.buf) < self.lookback:
+        self._sum += price - self._ring[self._idx]
+        self._ring[self._idx] = price
+        self._idx = (self._idx + 1) % self.lookback
+        if self._filled < self.lookback:
+            self._filled += 1
+        if self._filled < self.lookback:
             return None
-        return sum(self.buf)/len(self.buf)
+        return self._sum / self._filled
 
     def on_bar(self, price: float, regime: str):
         ma = self.update_ma(price)
@@ -1,6 +1,8 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 
-@dataclass
+# slots=True drops the per-instance __dict__ (~40% smaller objects,
+# faster attribute access in on_bar's hot path)
+@dataclass(slots=True)
 class Trade:
     side: str               # LONG or SHORT
     entry_ts: str
@@ -16,7 +18,7 @@ class Trade:
     exit_reason: str = ""  # SL | BE | TSL
     R: float = 0.0
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ExitParams:
     atr_mult_sl: float = 15.0
     atr_mult_tp: float = 60.0
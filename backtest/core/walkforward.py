@@ -1,16 +1,28 @@
+import calendar
 from dataclasses import dataclass
 from datetime import datetime
-from dateutil.relativedelta import relativedelta
+from functools import lru_cache
 
-@dataclass
+@lru_cache(maxsize=1024)
+def _parse_iso(s: str) -> datetime:
+    """fromisoformat with the trailing-Z strip, memoized: window bounds
+    are produced by .isoformat() upstream so repeats are exact."""
+    return datetime.fromisoformat(s.replace("Z", ""))
+
+
+@dataclass(frozen=True, slots=True)
 class WFSpec:
-    """Specification for walk-forward windows (in months)."""
+    """Specification for walk-forward windows (in months).
+
+    Frozen and slotted: specs are immutable value objects, and being
+    hashable lets them key caches directly."""
 
     train_months: int
     test_months: int
     step_months: int
 
 
+@lru_cache(maxsize=64)
 def parse_wf(s: str) -> WFSpec:
     """Parse a walk-forward spec string.
 
@@ -20,10 +32,15 @@ def parse_wf(s: str) -> WFSpec:
     """
 
     try:
-        parts = dict(p.split("=", 1) for p in s.split(","))
-        train = int(parts["train"])
-        test = int(parts["test"])
-        step = int(parts["step"])
+        parts = {}
+        for p in s.split(","):
+            k, sep, v = p.partition("=")
+            if not sep:
+                raise ValueError(f"bad segment: {p}")
+            parts[k] = int(v)
+        train = parts["train"]
+        test = parts["test"]
+        step = parts["step"]
     except Exception as exc:
         raise ValueError("walkforward must be like 'train=3,test=1,step=1'") from exc
 
@@ -35,29 +52,54 @@ def parse_wf(s: str) -> WFSpec:
 
     return WFSpec(train_months=train, test_months=test, step_months=step)
 
+def _add_months(dt: datetime, n: int) -> datetime:
+    """Shift a datetime by whole months, clamping the day like
+    dateutil.relativedelta does (Mar 31 - 1 month -> Feb 28)."""
+    y, m = divmod(dt.month - 1 + n, 12)
+    y += dt.year
+    m += 1
+    day = min(dt.day, calendar.monthrange(y, m)[1])
+    return dt.replace(year=y, month=m, day=day)
+
 def month_range(start_iso: str, end_iso: str):
-    start = datetime.fromisoformat(start_iso.replace("Z",""))
-    end = datetime.fromisoformat(end_iso.replace("Z",""))
+    start = _parse_iso(start_iso)
+    end = _parse_iso(end_iso)
     cur = start.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
     while cur < end:
-        nxt = cur + relativedelta(months=1)
+        nxt = _add_months(cur, 1)
         yield cur, nxt
         cur = nxt
 
-def build_wf_windows(start_iso: str, end_iso: str, spec: WFSpec):
-    months = list(month_range(start_iso, end_iso))
-    if not months:
-        return []
+@lru_cache(maxsize=256)
+def _build_wf_windows_cached(start_iso: str, end_iso: str,
+                             train: int, test: int, step: int):
+    start = _parse_iso(start_iso)
+    end = _parse_iso(end_iso)
+    m0 = start.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    # month count and final boundary as scalars; no per-month tuple list
+    diff = (end.year - m0.year) * 12 + (end.month - m0.month)
+    count = diff + (1 if end > _add_months(m0, diff) else 0)
+    if count <= 0:
+        return ()
+    if train + test > count:
+        return ()
+    # every fold start is day-1 midnight, so the test_end <= range-end
+    # boundary reduces to the month-index bound i <= count - train - test
     windows = []
-    i = 0
-    while True:
-        train_start = months[i][0]
-        train_end = train_start + relativedelta(months=spec.train_months)
-        test_end = train_end + relativedelta(months=spec.test_months)
-        if test_end > months[-1][1]:
-            break
-        windows.append((train_start.isoformat(), train_end.isoformat(), train_end.isoformat(), test_end.isoformat()))
-        i += spec.step_months
-        if i >= len(months):
-            break
-    return windows
+    for i in range(0, count - train - test + 1, step):
+        train_start = _add_months(m0, i)
+        train_end = _add_months(train_start, train)
+        test_end = _add_months(train_end, test)
+        ts = train_start.isoformat()
+        te = train_end.isoformat()
+        xe = test_end.isoformat()
+        windows.append((ts, te, te, xe))
+    return tuple(windows)
+
+def build_wf_windows(start_iso: str, end_iso: str, spec: WFSpec):
+    """Pure function of (start, end, spec): sweeps and test suites rebuild
+    the same windows constantly, so the real work is memoized on the
+    unpacked spec fields (hashable scalars)."""
+    return _build_wf_windows_cached(
+        start_iso, end_iso, spec.train_months, spec.test_months, spec.step_months
+    )
@@ -8,19 +8,39 @@ from __future__ import annotations
 
 import argparse
 import json
+import logging
 import os
-from datetime import datetime
+import pickle
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, List, Tuple
 
-from dateutil.relativedelta import relativedelta
-
-from backtest.core.backtest_engine import run_symbol
 from backtest.core.config_loader import deep_update, load_config
 from backtest.core.logger import setup_logger
-from backtest.core.reporting import write_json
-from backtest.core.walkforward import WFSpec, build_wf_windows, parse_wf
-from tqdm.auto import tqdm
+from backtest.core.walkforward import WFSpec, _add_months, _parse_iso, build_wf_windows, parse_wf
+
+_tqdm = None
+
+
+def _get_tqdm():
+    """Import tqdm.auto on first use; its notebook detection is slow on
+    cold start and --dry-run / piped runs never show a bar."""
+    global _tqdm
+    if _tqdm is None:
+        from tqdm.auto import tqdm
+        _tqdm = tqdm
+    return _tqdm
+
+
+def _progress(it, enabled: bool, **kwargs):
+    """Wrap an iterable (or None, for a manual bar) in tqdm when enabled."""
+    if not enabled:
+        return it
+    kwargs.setdefault("dynamic_ncols", True)
+    kwargs.setdefault("mininterval", 0.2)
+    kwargs.setdefault("smoothing", 0.1)
+    return _get_tqdm()(it, **kwargs)
 
 
 def parse_args() -> argparse.Namespace:
@@ -68,6 +88,101 @@ def parse_args() -> argparse.Namespace:
     return p.parse_args()
 
 
+# worker-process state installed by _worker_init (per-pool, not per-task)
+_WCFG: Dict[str, Any] = {}
+_WLOG = None
+_WOUT = Path(".")
+
+
+def _worker_init(cfg_bytes: bytes, logger_name: str, outputs_dir_str: str) -> None:
+    """Pool initializer: ship the config to each worker exactly once.
+
+    Submitting cfg inside every task tuple would re-pickle the same
+    nested dict per (fold, symbol) cell; the initializer sends it once
+    per worker. The logger is re-resolved by name because logger objects
+    do not pickle across process boundaries.
+    """
+    global _WCFG, _WLOG, _WOUT
+    _WCFG = pickle.loads(cfg_bytes)
+    _WLOG = logging.getLogger(logger_name)
+    _WOUT = Path(outputs_dir_str)
+
+
+def _pool(workers: int, cfg: dict, logger, outputs_dir: Path) -> ProcessPoolExecutor:
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_worker_init,
+        initargs=(
+            pickle.dumps(cfg, protocol=pickle.HIGHEST_PROTOCOL),
+            logger.name,
+            str(outputs_dir),
+        ),
+    )
+
+
+def _run_one(task: Tuple) -> Tuple[str, Dict[str, Any]]:
+    """Picklable worker: run one symbol inside a pool process."""
+    from backtest.core.backtest_engine import run_symbol
+
+    sym, data_root, start, end = task
+    summary = run_symbol(
+        sym, Path(data_root), start, end, _WCFG, _WOUT, _WLOG, progress=False,
+    )
+    return sym, summary
+
+
+def _run_wf_symbol_task(task: Tuple) -> List[Tuple[int, str, Dict[str, Any]]]:
+    """Picklable worker: run every walk-forward fold of one symbol.
+
+    Folds of the same symbol rewrite the same per-symbol timeline and
+    trades files, so they must not run concurrently; keeping a symbol's
+    folds serial inside one task leaves the on-disk artifacts
+    deterministic (last fold wins, as in the serial path) while symbols
+    still fan out across workers.
+    """
+    from backtest.core.backtest_engine import run_symbol
+
+    sym, data_root, folds = task
+    out = []
+    for idx, test_s, test_e in folds:
+        summary = run_symbol(
+            sym, Path(data_root), test_s, test_e, _WCFG, _WOUT, _WLOG, progress=False,
+        )
+        out.append((idx, sym, summary))
+    return out
+
+
+def _run_symbols_parallel(
+    symbols: Iterable[str],
+    data_root: Path,
+    start: str | None,
+    end: str | None,
+    cfg: dict,
+    outputs_dir: Path,
+    logger,
+    workers: int,
+    progress: bool = True,
+) -> Dict[str, Any]:
+    """Run independent symbols across a process pool (per-bar progress is
+    disabled in workers to keep the terminal sane).
+
+    Results are collected with as_completed so fast symbols report as
+    soon as they finish instead of waiting behind slow ones."""
+    tasks = [(sym, str(data_root), start, end) for sym in symbols]
+    out: Dict[str, Any] = {}
+    with _pool(workers, cfg, logger, outputs_dir) as ex:
+        futures = [ex.submit(_run_one, t) for t in tasks]
+        fut_iter = _progress(
+            as_completed(futures), progress,
+            total=len(futures), desc="symbols", unit="symbol",
+        )
+        for fut in fut_iter:
+            sym, summary = fut.result()
+            out[sym] = summary
+    # completion order is nondeterministic; emit in submission order
+    return {sym: out[sym] for sym in symbols if sym in out}
+
+
 def main() -> None:
     args = parse_args()
     cfg = load_config(args.config)
@@ -99,14 +214,20 @@ def main() -> None:
         overrides["backtest"]["workers"] = args.workers
 
     cfg = deep_update(cfg, overrides)
+    bt = cfg.get("backtest") or {}
+    paths = cfg.get("paths") or {}
 
     if args.dry_run:
-        print(json.dumps(cfg.get("backtest", {}), indent=2))
+        print(json.dumps(bt, indent=2))
         return
 
-    mode = cfg.get("backtest", {}).get("mode", "insample")
-    data_root = Path(cfg.get("paths", {}).get("data_root", "data"))
-    outputs_dir = Path(cfg.get("paths", {}).get("outputs_dir", "outputs"))
+    # heavy imports (engine -> numba/pyarrow) only once we know we run
+    from backtest.core.backtest_engine import run_symbol
+    from backtest.core.reporting import write_json
+
+    mode = bt.get("mode", "insample")
+    data_root = Path(paths.get("data_root", "data"))
+    outputs_dir = Path(paths.get("outputs_dir", "outputs"))
     symbols = cfg.get("symbols", ["BTCUSDT", "ETHUSDT", "SOLUSDT"])
     if args.symbols:
         symbols = [s.strip() for s in args.symbols.split(",") if s.strip()]
@@ -121,56 +242,62 @@ def main() -> None:
     if os.environ.get("LIVE_ENGINE_PACKAGE"):
         logger.info(f"LIVE_ENGINE_PACKAGE={os.environ['LIVE_ENGINE_PACKAGE']}")
 
+    workers = bt.get("workers") or 1
+    bar_progress = args.progress == "bar"
+
     summaries: Dict[str, Any] = {}
     if mode == "insample":
-        sym_iter = symbols
-        if args.progress in ("symbol", "bar"):
-            sym_iter = tqdm(
-                symbols,
-                desc="symbols",
-                unit="symbol",
-                dynamic_ncols=True,
-                mininterval=0.2,
-                smoothing=0.1,
-            )
-        for sym in sym_iter:
-            summaries[sym] = run_symbol(
-                sym,
-                data_root,
-                args.start,
-                args.end,
-                cfg,
-                outputs_dir,
-                logger,
-                progress=(args.progress == "bar"),
+        if workers > 1:
+            summaries.update(_run_symbols_parallel(
+                symbols, data_root, args.start, args.end, cfg, outputs_dir, logger, workers,
+                progress=args.progress in ("symbol", "bar"),
+            ))
+        else:
+            sym_iter = _progress(
+                symbols, args.progress in ("symbol", "bar"),
+                desc="symbols", unit="symbol",
             )
+            for sym in sym_iter:
+                summaries[sym] = run_symbol(
+                    sym,
+                    data_root,
+                    args.start,
+                    args.end,
+                    cfg,
+                    outputs_dir,
+                    logger,
+                    progress=bar_progress,
+                )
     elif mode == "oos":
-        k = cfg.get("backtest", {}).get("oos_last_k_months", 1)
-        end_iso = args.end or datetime.utcnow().isoformat()
-        start_iso = (datetime.fromisoformat(end_iso) - relativedelta(months=k)).isoformat()
-        sym_iter = symbols
-        if args.progress in ("symbol", "bar"):
-            sym_iter = tqdm(
-                symbols,
-                desc="symbols",
-                unit="symbol",
-                dynamic_ncols=True,
-                mininterval=0.2,
-                smoothing=0.1,
-            )
-        for sym in sym_iter:
-            summaries[sym] = run_symbol(
-                sym,
-                data_root,
-                start_iso,
-                end_iso,
-                cfg,
-                outputs_dir,
-                logger,
-                progress=(args.progress == "bar"),
+        k = bt.get("oos_last_k_months", 1)
+        end_iso = args.end
+        if not end_iso:
+            # naive-UTC "now"; utcnow() is deprecated from 3.12
+            end_iso = datetime.now(timezone.utc).replace(tzinfo=None).isoformat()
+        start_iso = _add_months(_parse_iso(end_iso), -k).isoformat()
+        if workers > 1:
+            summaries.update(_run_symbols_parallel(
+                symbols, data_root, start_iso, end_iso, cfg, outputs_dir, logger, workers,
+                progress=args.progress in ("symbol", "bar"),
+            ))
+        else:
+            sym_iter = _progress(
+                symbols, args.progress in ("symbol", "bar"),
+                desc="symbols", unit="symbol",
             )
+            for sym in sym_iter:
+                summaries[sym] = run_symbol(
+                    sym,
+                    data_root,
+                    start_iso,
+                    end_iso,
+                    cfg,
+                    outputs_dir,
+                    logger,
+                    progress=bar_progress,
+                )
     elif mode == "walkforward":
-        wf_cfg = cfg["backtest"]["walkforward"]
+        wf_cfg = bt["walkforward"]
         wf = WFSpec(**wf_cfg)
         if not args.start or not args.end:
             logger.warning(
@@ -181,45 +308,64 @@ def main() -> None:
             args.end or "2025-08-01T00:00:00",
             wf,
         )
-        fold_iter = enumerate(windows)
-        if args.progress != "off":
-            fold_iter = enumerate(
-                tqdm(
-                    windows,
-                    desc="folds",
-                    unit="fold",
-                    dynamic_ncols=True,
-                    mininterval=0.2,
-                    smoothing=0.1,
+        if workers > 1:
+            # one task per symbol, each walking all folds in order:
+            # symbols are independent, but folds of a symbol share its
+            # output files and must stay serial
+            for idx, (train_s, train_e, test_s, test_e) in enumerate(windows):
+                logger.info(
+                    "WALKFORWARD fold=%d train=[%s..%s) test=[%s..%s)",
+                    idx, train_s, train_e, test_s, test_e,
+                )
+            folds = [(idx, w[2], w[3]) for idx, w in enumerate(windows)]
+            tasks: List[Tuple] = [
+                (sym, str(data_root), folds) for sym in symbols
+            ]
+            with _pool(workers, cfg, logger, outputs_dir) as ex:
+                futures = [ex.submit(_run_wf_symbol_task, t) for t in tasks]
+                fut_iter = _progress(
+                    as_completed(futures), args.progress != "off",
+                    total=len(futures), desc="wf symbols", unit="symbol",
                 )
+                results: Dict[Tuple[int, str], Dict[str, Any]] = {}
+                for fut in fut_iter:
+                    for idx, sym, summary in fut.result():
+                        results[(idx, sym)] = summary
+            # single summary write, keyed in the serial fold-major order
+            # regardless of completion order
+            summaries.update(
+                {f"{sym}/fold_{idx}": results[(idx, sym)]
+                 for idx in range(len(windows)) for sym in symbols}
             )
-        for idx, (train_s, train_e, test_s, test_e) in fold_iter:
-            logger.info(
-                f"WALKFORWARD fold={idx} train=[{train_s}..{train_e}) test=[{test_s}..{test_e})"
+        else:
+            # one flat bar over the whole fold-by-symbol grid; nested
+            # per-fold bars spend more time on setup/teardown than work
+            # when folds number in the hundreds
+            pbar = _progress(
+                None, args.progress != "off",
+                total=len(windows) * len(symbols), desc="wf folds", unit="symbol",
             )
-            sym_iter = symbols
-            if args.progress in ("symbol", "bar"):
-                sym_iter = tqdm(
-                    symbols,
-                    desc=f"fold {idx} symbols",
-                    unit="symbol",
-                    dynamic_ncols=True,
-                    leave=False,
-                    mininterval=0.2,
-                    smoothing=0.1,
-                )
-            for sym in sym_iter:
-                key = f"{sym}/fold_{idx}"
-                summaries[key] = run_symbol(
-                    sym,
-                    data_root,
-                    test_s,
-                    test_e,
-                    cfg,
-                    outputs_dir,
-                    logger,
-                    progress=(args.progress == "bar"),
+            for idx, (train_s, train_e, test_s, test_e) in enumerate(windows):
+                logger.info(
+                    "WALKFORWARD fold=%d train=[%s..%s) test=[%s..%s)",
+                    idx, train_s, train_e, test_s, test_e,
                 )
+                for sym in symbols:
+                    key = f"{sym}/fold_{idx}"
+                    summaries[key] = run_symbol(
+                        sym,
+                        data_root,
+                        test_s,
+                        test_e,
+                        cfg,
+                        outputs_dir,
+                        logger,
+                        progress=bar_progress,
+                    )
+                    if pbar is not None:
+                        pbar.update(1)
+            if pbar is not None:
+                pbar.close()
 
     write_json(outputs_dir / "backtest/summary.json", summaries)
     logger.info("=== BACKTEST RUN DONE ===")
@@ -1,4 +1,6 @@
-from backtest.core.atr import ATR
+import numpy as np
+
+from backtest.core.atr import ATR, compute_atr_batch
 
 def test_atr_basic_sequence():
     atr = ATR(period=3)
@@ -13,3 +15,27 @@ def test_atr_basic_sequence():
         vals.append(atr.update(o,h,l,c))
     assert vals[-1] is not None
     assert vals[-1] > 0
+
+
+def test_atr_batch_matches_update():
+    rng = np.random.default_rng(3)
+    n = 200
+    c = 100.0 + np.cumsum(rng.normal(0, 0.5, n))
+    h = c + rng.uniform(0, 1, n)
+    l = c - rng.uniform(0, 1, n)
+    o = np.concatenate(([c[0]], c[:-1]))
+
+    atr = ATR(period=14)
+    ref = [atr.update(o[i], h[i], l[i], c[i]) for i in range(n)]
+    batch = compute_atr_batch(o, h, l, c, period=14)
+
+    for i in range(n):
+        if ref[i] is None:
+            assert np.isnan(batch[i])
+        else:
+            assert batch[i] == ref[i]
+
+
+def test_atr_batch_short_series_is_all_nan():
+    z = np.zeros(5)
+    assert np.isnan(compute_atr_batch(z, z, z, z, period=14)).all()
@@ -0,0 +1,133 @@
+import os
+
+import pytest
+
+from backtest.core.data_loader import (
+    _to_epoch_seconds,
+    iter_ohlcv_csv,
+    iter_symbol_bars,
+    load_symbol_bars_arrays,
+)
+
+
+def test_ohlcv_schema(tmp_path):
+    p = tmp_path / "BTCUSDT-2025-01.csv"
+    p.write_text(
+        "timestamp,open,high,low,close,volume\n"
+        "1735689600,100,101,99,100.5,3\n"
+        "1735689660,100.5,102,100,101,1\n"
+    )
+    bars = list(iter_ohlcv_csv(p))
+    assert bars == [
+        ("2025-01-01T00:00:00+00:00", 100.0, 101.0, 99.0, 100.5, 3.0),
+        ("2025-01-01T00:01:00+00:00", 100.5, 102.0, 100.0, 101.0, 1.0),
+    ]
+
+
+def test_ticks_aggregate_to_1m(tmp_path):
+    p = tmp_path / "BTCUSDT-2025-01.csv"
+    p.write_text(
+        "time,price,qty\n"
+        "1735689600,100,1\n"
+        "1735689630,102,2\n"
+        "1735689659,99,1\n"
+        "1735689660,101,4\n"
+    )
+    bars = list(iter_ohlcv_csv(p))
+    assert bars == [
+        ("2025-01-01T00:00:00+00:00", 100.0, 102.0, 99.0, 99.0, 4.0),
+        ("2025-01-01T00:01:00+00:00", 101.0, 101.0, 101.0, 101.0, 4.0),
+    ]
+
+
+def test_arrays_match_iterator(tmp_path):
+    symdir = tmp_path / "BTCUSDT"
+    symdir.mkdir()
+    (symdir / "BTCUSDT-2025-01.csv").write_text(
+        "timestamp,open,high,low,close,volume\n"
+        "1735689600,100,101,99,100.5,3\n"
+        "1735689660,100.5,102,100,101,1\n"
+        "1735689720,101,103,101,102,2\n"
+    )
+    start, end = "2025-01-01T00:01:00", None
+    bars = list(iter_symbol_bars(tmp_path, "BTCUSDT", start, end))
+    ts, o, h, l, c, v = load_symbol_bars_arrays(tmp_path, "BTCUSDT", start, end)
+    assert list(ts) == [_to_epoch_seconds(b[0]) for b in bars]
+    for arr, col in ((o, 1), (h, 2), (l, 3), (c, 4), (v, 5)):
+        assert list(arr) == [b[col] for b in bars]
+
+
+def test_ticks_arrays_match_iterator(tmp_path):
+    symdir = tmp_path / "BTCUSDT"
+    symdir.mkdir()
+    (symdir / "BTCUSDT-2025-01.csv").write_text(
+        "time,price,qty\n"
+        "1735689600,100,1\n"
+        "1735689630,102,2\n"
+        "1735689659,99,1\n"
+        "1735689660,101,4\n"
+        "1735689725,103,2\n"
+    )
+    bars = list(iter_symbol_bars(tmp_path, "BTCUSDT", None, None))
+    ts, o, h, l, c, v = load_symbol_bars_arrays(tmp_path, "BTCUSDT", None, None)
+    assert list(ts) == [_to_epoch_seconds(b[0]) for b in bars]
+    for arr, col in ((o, 1), (h, 2), (l, 3), (c, 4), (v, 5)):
+        assert list(arr) == [b[col] for b in bars]
+
+
+def test_ticks_without_timestamp_column_yields_nothing(tmp_path):
+    p = tmp_path / "BTCUSDT-2025-01.csv"
+    p.write_text("price,qty\n100,1\n101,2\n")
+    assert list(iter_ohlcv_csv(p)) == []
+
+
+def test_ticks_null_timestamp_row_skipped(tmp_path):
+    symdir = tmp_path / "BTCUSDT"
+    symdir.mkdir()
+    (symdir / "BTCUSDT-2025-01.csv").write_text(
+        "time,price,qty\n"
+        "1735689600,100,1\n"
+        ",999,9\n"
+        "1735689660,101,4\n"
+    )
+    bars = list(iter_symbol_bars(tmp_path, "BTCUSDT", None, None))
+    assert len(bars) == 2
+    ts, o, h, l, c, v = load_symbol_bars_arrays(tmp_path, "BTCUSDT", None, None)
+    assert list(ts) == [_to_epoch_seconds(b[0]) for b in bars]
+    for arr, col in ((o, 1), (h, 2), (l, 3), (c, 4), (v, 5)):
+        assert list(arr) == [b[col] for b in bars]
+
+
+def test_schema_marker_persisted(tmp_path):
+    symdir = tmp_path / "BTCUSDT"
+    symdir.mkdir()
+    (symdir / "BTCUSDT-2025-01.csv").write_text(
+        "timestamp,open,high,low,close,volume\n"
+        "1735689600,100,101,99,100.5,3\n"
+    )
+    list(iter_symbol_bars(tmp_path, "BTCUSDT", None, None))
+    assert (symdir / ".schema").read_text().strip() == "ohlcv"
+
+
+def test_parquet_cache_roundtrip(tmp_path):
+    pytest.importorskip("pyarrow")
+    symdir = tmp_path / "BTCUSDT"
+    symdir.mkdir()
+    csv_fp = symdir / "BTCUSDT-2025-01.csv"
+    csv_fp.write_text(
+        "timestamp,open,high,low,close,volume\n"
+        "1735689600,100,101,99,100.5,3\n"
+    )
+    first = load_symbol_bars_arrays(tmp_path, "BTCUSDT", None, None)
+    assert (symdir / "BTCUSDT-2025-01.parquet").exists()
+    cached = load_symbol_bars_arrays(tmp_path, "BTCUSDT", None, None)
+    for a, b in zip(first, cached):
+        assert list(a) == list(b)
+    # touching the CSV invalidates the cache
+    csv_fp.write_text(
+        "timestamp,open,high,low,close,volume\n"
+        "1735689600,200,201,199,200.5,3\n"
+    )
+    os.utime(csv_fp, None)
+    ts, o, *_ = load_symbol_bars_arrays(tmp_path, "BTCUSDT", None, None)
+    assert o[0] == 200.0
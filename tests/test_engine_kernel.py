@@ -0,0 +1,92 @@
+import numpy as np
+
+from backtest.core import _engine_numba
+from backtest.core.atr import ATR
+from backtest.core.regime_classifier import SlopeRegime
+from backtest.core.signal_engine import PullbackResumption
+from backtest.core.trade_manager import TradeManager, ExitParams
+
+PARAMS = dict(
+    n_short=5, n_long=20, ma_lookback=4, atr_period=5,
+    sl_mult=2.0, tp_mult=6.0, be_prog=0.5, tsl_step_mult=1.5, risk_usd=1.0,
+)
+
+
+def _make_bars(n=600, seed=7):
+    rng = np.random.default_rng(seed)
+    c = 100.0 + np.cumsum(rng.normal(0.02, 0.5, n)) + 5.0 * np.sin(np.arange(n) / 40.0)
+    o = np.roll(c, 1)
+    o[0] = c[0]
+    spread = np.abs(rng.normal(0.0, 0.3, n))
+    h = np.maximum(o, c) + spread
+    l = np.minimum(o, c) - spread
+    return o, h, l, c
+
+
+def _reference_trades(o, h, l, c):
+    """Mirror of the per-bar engine loop using the stub classes."""
+    regime = SlopeRegime(n_short=PARAMS["n_short"], n_long=PARAMS["n_long"])
+    signal = PullbackResumption(ma_lookback=PARAMS["ma_lookback"])
+    tm = TradeManager(ExitParams(
+        atr_mult_sl=PARAMS["sl_mult"], atr_mult_tp=PARAMS["tp_mult"],
+        breakeven_progress=PARAMS["be_prog"], tsl_step_atr_mult=PARAMS["tsl_step_mult"],
+    ))
+    atr = ATR(period=PARAMS["atr_period"])
+    trades = []
+    for i in range(len(c)):
+        cur_atr = atr.update(o[i], h[i], l[i], c[i])
+        reg = regime.update(c[i])
+        if tm.active is None and cur_atr is not None:
+            sig = signal.on_bar(c[i], reg)
+            if sig in ("LONG", "SHORT") and reg in ("UP", "DOWN"):
+                sl_dist = cur_atr * PARAMS["sl_mult"]
+                qty = PARAMS["risk_usd"] / sl_dist / c[i] if sl_dist > 0 and c[i] > 0 else 0.0
+                tm.open(i, sig, c[i], cur_atr, qty)
+        else:
+            done = tm.on_bar(i, h[i], l[i], c[i], cur_atr or 0.0)
+            if done:
+                trades.append(done)
+    if tm.active is not None:
+        t = tm.active
+        t.exit_ts = len(c) - 1
+        t.exit_price = c[-1]
+        t.exit_reason = "BE"
+        t.R = 0.0
+        trades.append(t)
+    return trades
+
+
+def test_kernel_matches_stub_classes():
+    o, h, l, c = _make_bars()
+    n = len(c)
+    atr_arr = np.empty(n)
+    regime_arr = np.empty(n, np.int8)
+    signal_arr = np.empty(n, np.int8)
+    pos_arr = np.empty(n, np.int8)
+    sl_arr = np.empty(n)
+    tp_arr = np.empty(n)
+
+    (entry_idx, exit_idx, side, entry_px, exit_px,
+     reason, r_vals, size, t_sl, t_tp) = _engine_numba.run_symbol_core(
+        o, h, l, c,
+        PARAMS["n_short"], PARAMS["n_long"], PARAMS["ma_lookback"], PARAMS["atr_period"],
+        PARAMS["sl_mult"], PARAMS["tp_mult"], PARAMS["be_prog"],
+        PARAMS["tsl_step_mult"], PARAMS["risk_usd"],
+        atr_arr, regime_arr, signal_arr, pos_arr, sl_arr, tp_arr,
+    )
+
+    ref = _reference_trades(o, h, l, c)
+    assert len(ref) > 3  # the synthetic walk must actually trade
+    assert entry_idx.shape[0] == len(ref)
+    reason_str = ("SL", "TSL", "BE")
+    for j, t in enumerate(ref):
+        assert entry_idx[j] == t.entry_ts
+        assert exit_idx[j] == t.exit_ts
+        assert ("LONG" if side[j] > 0 else "SHORT") == t.side
+        assert reason_str[reason[j]] == t.exit_reason
+        assert np.isclose(entry_px[j], t.entry_price)
+        assert np.isclose(exit_px[j], t.exit_price)
+        assert np.isclose(r_vals[j], t.R)
+        assert np.isclose(size[j], t.size)
+        assert np.isclose(t_sl[j], t.sl)
+        assert np.isclose(t_tp[j], t.tp)
@@ -1,6 +1,8 @@
+from datetime import datetime
+
 import pytest
 
-from backtest.core.walkforward import parse_wf
+from backtest.core.walkforward import _add_months, build_wf_windows, parse_wf
 
 
 def test_parse_wf_valid() -> None:
@@ -15,3 +17,25 @@ def test_parse_wf_invalid(bad: str) -> None:
     with pytest.raises(ValueError):
         parse_wf(bad)
 
+
+
+def test_build_wf_windows_monthly_steps() -> None:
+    spec = parse_wf("train=3,test=1,step=1")
+    windows = build_wf_windows("2025-01-01T00:00:00", "2025-07-01T00:00:00", spec)
+    assert windows[0] == (
+        "2025-01-01T00:00:00",
+        "2025-04-01T00:00:00",
+        "2025-04-01T00:00:00",
+        "2025-05-01T00:00:00",
+    )
+    # folds step one month and stop once the test window would overrun
+    assert [w[2] for w in windows] == [
+        "2025-04-01T00:00:00",
+        "2025-05-01T00:00:00",
+        "2025-06-01T00:00:00",
+    ]
+
+
+def test_add_months_clamps_day() -> None:
+    assert _add_months(datetime(2025, 3, 31), -1) == datetime(2025, 2, 28)
+    assert _add_months(datetime(2024, 12, 15), 1) == datetime(2025, 1, 15)